@@ -5,13 +5,12 @@ Main controller coordinating Model and View using AppState.
 from typing import Optional, List, Dict, Any
 import pandas as pd
 from PySide6.QtWidgets import QMessageBox, QApplication
-from PySide6.QtCore import Qt, QObject, Slot
+from PySide6.QtCore import Qt, QObject, Slot, QTimer
 
 from models.data_manager import DataManager
 from models.data_models import AppState, ChartData
 from models.recent_symbols import RecentSymbolsManager
 from models.enums import ChartType, Interval, MAType
-from models.indicators.registry import IndicatorManager
 from views.main_view import MainView
 from views.search_dialog import SymbolSearchDialog
 from views.themes import THEMES
@@ -27,7 +26,6 @@ class MainController(QObject):
         self.view = view
         self.state = AppState()
         self.recent_manager = RecentSymbolsManager()
-        self.indicator_manager = IndicatorManager()
         
         self._setup_connections()
         
@@ -36,7 +34,8 @@ class MainController(QObject):
         self._on_indicator_settings_changed()
         self._sync_font_settings()
         self._refresh_recent_symbols_ui()
-        self._load_initial_data()
+        # Kick off the first download once the event loop runs, so the window paints first
+        QTimer.singleShot(0, self._load_initial_data)
 
     def _setup_connections(self):
         # View -> Controller
@@ -56,6 +55,7 @@ class MainController(QObject):
         self.model.data_ready.connect(self._on_data_ready)
         self.model.loading_error.connect(self._on_loading_error)
         self.model.search_results.connect(self._on_search_results)
+        self.model.indicators_ready.connect(self._on_indicators_ready)
         
         # Chart Interactions
         self.view.chart.hovered_data_changed.connect(self._on_chart_hover)
@@ -103,14 +103,12 @@ class MainController(QObject):
         self.state.td_settings.countdown_max = s.countdown_spin.value()
         
         self.state.bb_settings.visible = s.bb_checkbox.isChecked()
-        self.state.bb_settings.period = s.bb_period_spin.value()
-        self.state.bb_settings.ma_type = MAType(s.bb_ma_type_combo.currentData())
-        
-        stds = []
-        if s.bb_std_1_check.isChecked(): stds.append(1.0)
-        if s.bb_std_2_check.isChecked(): stds.append(2.0)
-        if s.bb_std_3_check.isChecked(): stds.append(3.0)
-        self.state.bb_settings.std_devs = stds
+        # BB widgets exist only once the panel has been opened; until then the defaults apply
+        if s.bb_container is not None:
+            self.state.bb_settings.period = s.bb_period_spin.value()
+            self.state.bb_settings.ma_type = MAType(s.bb_ma_type_combo.currentData())
+            self.state.bb_settings.std_devs = s.active_sds()
+        stds = self.state.bb_settings.std_devs
         
         # Update View properties
         self.view.chart.price_pane.show_td = self.state.td_settings.visible
@@ -119,22 +117,21 @@ class MainController(QObject):
         self.view.chart.price_pane.td_settings = self.state.td_settings
         self.view.chart.price_pane.bb_settings = self.state.bb_settings
         
-        # If we have raw data, recalculate indicators
-        if self.model.current_data:
-            raw_df = self.model.current_data.raw_df
-            # Re-run pipeline on the original raw data
-            processed_df = self.indicator_manager.calculate_all(raw_df.copy(), self.state)
-            self.model.current_data.df = processed_df
-            
-            # Update the main chart container's data so hover emitting works
-            self.view.chart.df = processed_df
-            
-            # Synchronize the new dataframe back to the panes
-            self.view.chart.price_pane.set_data(
-                processed_df, 
-                self.view.chart.visible_bars, 
-                self.view.chart.scroll_offset
-            )
+        # If we have raw data, recalculate indicators off the GUI thread
+        self.model.request_recalculation(self.state)
+
+    @Slot(object)
+    def _on_indicators_ready(self, processed_df: pd.DataFrame):
+        """Shows indicator columns recomputed by the model's background worker."""
+        # Update the main chart container's data so hover emitting works
+        self.view.chart.df = processed_df
+        
+        # Synchronize the new dataframe back to the panes
+        self.view.chart.price_pane.set_data(
+            processed_df, 
+            self.view.chart.visible_bars, 
+            self.view.chart.scroll_offset
+        )
 
     @Slot()
     def _on_font_settings_changed(self):
@@ -185,7 +182,7 @@ class MainController(QObject):
             QMessageBox.information(self.view, "Search", "No symbols found.")
             return
         
-        dialog = SymbolSearchDialog(self.view, results)
+        dialog = SymbolSearchDialog.get_or_create(self.view, results)
         if dialog.exec():
             self.view.symbol_input.setCurrentText(dialog.selected_symbol)
             self._on_load_requested(dialog.selected_symbol)
@@ -199,11 +196,11 @@ class MainController(QObject):
         
         # 1. Base OHLC
         html = (
-            f"<span style='color: {theme['text_main']};'>{data['Date']}</span> | "
-            f"O <span style='color: {theme['text_main']};'>{data['Open']:.2f}</span>  "
-            f"H <span style='color: {theme['bull']};'>{data['High']:.2f}</span>  "
-            f"L <span style='color: {theme['bear']};'>{data['Low']:.2f}</span>  "
-            f"C <span style='color: {theme['bull'] if data['Close'] >= data['Open'] else theme['bear']};'>{data['Close']:.2f}</span>"
+            f"<span style='color: {theme.text_main};'>{data['Date']}</span> | "
+            f"O <span style='color: {theme.text_main};'>{data['Open']:.2f}</span>  "
+            f"H <span style='color: {theme.bull};'>{data['High']:.2f}</span>  "
+            f"L <span style='color: {theme.bear};'>{data['Low']:.2f}</span>  "
+            f"C <span style='color: {theme.bull if data['Close'] >= data['Open'] else theme.bear};'>{data['Close']:.2f}</span>"
         )
         
         # 2. Bollinger Bands
@@ -211,7 +208,7 @@ class MainController(QObject):
             bb_parts = []
             mid_v = data.get('bb_middle')
             if mid_v is not None and not pd.isna(mid_v):
-                bb_parts.append(f"M <span style='color: {theme['bb_mid']};'>{mid_v:.2f}</span>")
+                bb_parts.append(f"M <span style='color: {theme.bb_mid};'>{mid_v:.2f}</span>")
             
             for std in self.state.bb_settings.std_devs:
                 up_v = data.get(f'bb_upper_{std}')
@@ -219,9 +216,9 @@ class MainController(QObject):
                 std_lbl = int(std) if std == int(std) else std
                 
                 if up_v is not None and not pd.isna(up_v):
-                    bb_parts.append(f"U({std_lbl}) <span style='color: {theme['bb_upper']};'>{up_v:.2f}</span>")
+                    bb_parts.append(f"U({std_lbl}) <span style='color: {theme.bb_upper};'>{up_v:.2f}</span>")
                 if lo_v is not None and not pd.isna(lo_v):
-                    bb_parts.append(f"L({std_lbl}) <span style='color: {theme['bb_lower']};'>{lo_v:.2f}</span>")
+                    bb_parts.append(f"L({std_lbl}) <span style='color: {theme.bb_lower};'>{lo_v:.2f}</span>")
             
             if bb_parts:
                 html += f" | BB({self.state.bb_settings.period}) " + "  ".join(bb_parts)
@@ -231,13 +228,13 @@ class MainController(QObject):
             td_parts = []
             sc, st = data.get('setup_count', 0), data.get('setup_type')
             if sc > 0:
-                color = theme['setup_buy'] if st == 'buy' else theme['setup_sell']
+                color = theme.setup_buy if st == 'buy' else theme.setup_sell
                 td_parts.append(f"S({'B' if st == 'buy' else 'S'}) <span style='color: {color};'>{int(sc)}</span>")
             
             cc, ct = data.get('countdown_count', 0), data.get('countdown_type')
             if cc > 0:
                 disp_c = "13+" if cc == 12.5 else str(int(cc))
-                color = theme['cd_buy'] if ct == 'buy' else theme['cd_sell']
+                color = theme.cd_buy if ct == 'buy' else theme.cd_sell
                 td_parts.append(f"C({'B' if ct == 'buy' else 'S'}) <span style='color: {color};'>{disp_c}</span>")
                 
             if td_parts:
@@ -43,6 +43,9 @@ def main():
     # The controller is responsible for initial data loading and theme application
     controller = MainController(model, view)
     
+    # Let running indicator recalculations finish before Qt tears down
+    app.aboutToQuit.connect(model.shutdown)
+    
     # Show the window and start the Qt event loop
     view.show()
     sys.exit(app.exec())
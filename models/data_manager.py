@@ -2,8 +2,8 @@
 Model component for fetching market data with threading support.
 """
 
-from typing import Optional, Dict, Any, List
-import yfinance as yf
+import copy
+from typing import Optional, Dict, Any, List, Tuple
 import pandas as pd
 from PySide6.QtCore import QObject, Signal, QThread
 from models.indicators.registry import IndicatorManager
@@ -31,6 +31,9 @@ class DataWorker(QObject):
 
     def run(self):
         try:
+            # Imported here so the heavy yfinance import runs on the worker thread,
+            # not while the main window is being built
+            import yfinance as yf
             ticker = yf.Ticker(self.symbol)
             df = ticker.history(period=self._get_safe_period(), interval=self.app_state.interval.value)
 
@@ -66,11 +69,34 @@ class SearchWorker(QObject):
 
     def run(self):
         try:
+            import yfinance as yf
             search = yf.Search(self.query, news_count=0)
             self.results_ready.emit(search.quotes)
         except Exception as e:
             self.error.emit(str(e))
 
+class RecalcWorker(QObject):
+    """
+    Background worker that re-runs the indicator pipeline on already downloaded data.
+    """
+    finished = Signal(int, object)
+    error = Signal(int, str)
+
+    def __init__(self, job_id: int, raw_df: pd.DataFrame, app_state: AppState):
+        super().__init__()
+        self.job_id = job_id
+        self.raw_df = raw_df
+        # Private snapshot: the GUI keeps editing the live settings while this runs
+        self.app_state = copy.deepcopy(app_state)
+        self.indicator_manager = IndicatorManager()
+
+    def run(self):
+        try:
+            processed_df = self.indicator_manager.calculate_all(self.raw_df.copy(), self.app_state)
+            self.finished.emit(self.job_id, processed_df)
+        except Exception as e:
+            self.error.emit(self.job_id, str(e))
+
 class DataManager(QObject):
     """
     Coordinates threading and manages the current dataset.
@@ -78,6 +104,7 @@ class DataManager(QObject):
     data_ready = Signal(ChartData)
     loading_error = Signal(str)
     search_results = Signal(list)
+    indicators_ready = Signal(object)
 
     def __init__(self):
         super().__init__()
@@ -86,6 +113,9 @@ class DataManager(QObject):
         self._worker: Optional[DataWorker] = None
         self._search_thread: Optional[QThread] = None
         self._search_worker: Optional[SearchWorker] = None
+        # Superseded recalculations are not waited on; they finish and are ignored
+        self._recalc_job_id = 0
+        self._recalc_jobs: List[Tuple[QThread, RecalcWorker]] = []
 
     def request_data(self, symbol: str, app_state: AppState):
         if self._thread and self._thread.isRunning():
@@ -120,7 +150,57 @@ class DataManager(QObject):
         
         self._search_thread.start()
 
+    def request_recalculation(self, app_state: AppState):
+        """Recomputes indicators for the current dataset on a worker thread."""
+        if self.current_data is None:
+            return
+
+        self._recalc_job_id += 1
+
+        thread = QThread()
+        worker = RecalcWorker(self._recalc_job_id, self.current_data.raw_df, app_state)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._handle_recalc_finished)
+        worker.error.connect(self._handle_recalc_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._release_recalc_job)
+
+        self._recalc_jobs.append((thread, worker))
+        thread.start()
+
+    def _handle_recalc_finished(self, job_id: int, processed_df: pd.DataFrame):
+        # Only the latest request for the current dataset is applied
+        if job_id != self._recalc_job_id or self.current_data is None:
+            return
+        self.current_data.df = processed_df
+        self.indicators_ready.emit(processed_df)
+
+    def _handle_recalc_error(self, job_id: int, message: str):
+        # A failure of a superseded job concerns settings the user has already replaced
+        if job_id != self._recalc_job_id:
+            return
+        self.loading_error.emit(message)
+
+    def _release_recalc_job(self):
+        """Forgets the job whose thread just finished; deleteLater frees the Qt objects."""
+        thread = self.sender()
+        self._recalc_jobs = [(t, w) for t, w in self._recalc_jobs if t is not thread]
+
+    def shutdown(self):
+        """Stops recalculation threads that are still running before the application exits."""
+        for thread, _ in self._recalc_jobs:
+            thread.quit()
+            thread.wait()
+        self._recalc_jobs = []
+
     def _handle_finished(self, chart_data: ChartData):
+        # Fresh data already carries indicators for the current settings
+        self._recalc_job_id += 1
         self.current_data = chart_data
         self.data_ready.emit(chart_data)
 
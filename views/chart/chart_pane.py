@@ -2,12 +2,13 @@
 Base class for a single chart pane in the multi-pane architecture.
 """
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Mapping
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPainter, QFont, QFontMetrics, QColor, QPen
 from PySide6.QtCore import Qt, QSize
 import pandas as pd
 from views.chart.coordinate_mapper import CoordinateMapper
+from views.themes import Theme, theme_colors
 
 class ChartPane(QWidget):
     """
@@ -22,7 +23,9 @@ class ChartPane(QWidget):
         super().__init__(parent)
         self.df: Optional[pd.DataFrame] = None
         self.mapper = CoordinateMapper()
-        self.theme: Dict[str, str] = {}
+        self.theme: Optional[Theme] = None
+        # Pre-parsed QColors for the current theme, so painting never parses hex strings
+        self.colors: Mapping[str, QColor] = {}
         
         # Rendering state from parent
         self.visible_bars = 150
@@ -36,23 +39,45 @@ class ChartPane(QWidget):
 
     def set_data(self, df: pd.DataFrame, visible_bars: int, scroll_offset: int):
         """Updates the local data reference and viewport state."""
-        self.df = df
+        # Scrolling and zooming re-send the same frame; only a new one needs re-caching
+        if df is not self.df:
+            self.df = df
+            self._cache_arrays(df)
         self.visible_bars = visible_bars
         self.scroll_offset = scroll_offset
         self.update()
 
-    def apply_theme(self, theme: Dict[str, str]):
+    def _cache_arrays(self, df: Optional[pd.DataFrame]):
+        """
+        Hook for subclasses to extract the columns they render into contiguous 
+        numpy arrays once per dataset, keeping pandas off the paint path.
+        """
+        pass
+
+    def apply_theme(self, theme: Theme):
         """Updates color configuration."""
         self.theme = theme
+        self.colors = theme_colors(theme)
         self.update()
 
+    def _color(self, key: str, default: str) -> QColor:
+        """Returns the theme color for key, or the given fallback before a theme is applied."""
+        color = self.colors.get(key)
+        return color if color is not None else QColor(default)
+
+    def _get_visible_range(self) -> Tuple[int, int]:
+        """Utility to compute the [start, end) row range based on scroll state."""
+        if self.df is None or self.df.empty:
+            return 0, 0
+        end_idx = len(self.df) - self.scroll_offset
+        start_idx = max(0, end_idx - self.visible_bars)
+        return start_idx, end_idx
+
     def _get_visible_data(self) -> Tuple[pd.DataFrame, int, int]:
         """Utility to slice the dataframe based on scroll state."""
         if self.df is None or self.df.empty:
             return pd.DataFrame(), 0, 0
-        total_len = len(self.df)
-        end_idx = total_len - self.scroll_offset
-        start_idx = max(0, end_idx - self.visible_bars)
+        start_idx, end_idx = self._get_visible_range()
         return self.df.iloc[start_idx:end_idx], start_idx, end_idx
 
     # NOTE TO DEVELOPERS: 
@@ -6,6 +6,7 @@ financial data (price, time) to screen coordinates (pixels).
 """
 
 from typing import Tuple
+import numpy as np
 from PySide6.QtCore import QPointF
 
 class CoordinateMapper:
@@ -19,6 +20,10 @@ class CoordinateMapper:
         padding_bottom: Bottom margin.
         padding_left: Left margin.
         padding_right: Right margin.
+        x_right: Pixel column where the plot area ends.
+        y_bottom: Pixel row where the plot area ends.
+        inner_w: Width of the plot area between the margins.
+        inner_h: Height of the plot area between the margins.
     """
     
     def __init__(self):
@@ -28,6 +33,10 @@ class CoordinateMapper:
         self.p_bottom = 0
         self.p_left = 0
         self.p_right = 0
+        self.x_right = 0
+        self.y_bottom = 0
+        self.inner_w = 0
+        self.inner_h = 0
         
         # State used for mapping
         self.min_p = 0.0
@@ -44,6 +53,12 @@ class CoordinateMapper:
         self.p_bottom = pb
         self.p_left = pl
         self.p_right = pr
+        
+        # Derived plot-area bounds, computed once per layout instead of per lookup
+        self.x_right = w - pr
+        self.y_bottom = h - pb
+        self.inner_w = w - pl - pr
+        self.inner_h = h - pt - pb
 
     def update_data_range(self, min_p: float, max_p: float, visible_bars: int, scroll_offset: int):
         """Updates the data bounds used for scaling."""
@@ -55,8 +70,11 @@ class CoordinateMapper:
 
     def price_to_y(self, price: float) -> float:
         """Maps a price value to a vertical pixel coordinate."""
-        h = self.view_h - self.p_top - self.p_bottom
-        return self.p_top + h - ((price - self.min_p) / self.p_range * h)
+        return self.y_bottom - ((price - self.min_p) / self.p_range * self.inner_h)
+
+    def prices_to_y(self, prices: np.ndarray) -> np.ndarray:
+        """Vectorized price_to_y for an array of price values."""
+        return self.y_bottom - ((prices - self.min_p) / self.p_range * self.inner_h)
 
     def index_to_x(self, relative_index: int) -> float:
         """
@@ -65,11 +83,17 @@ class CoordinateMapper:
         Args:
             relative_index: Index within the visible window.
         """
-        w = self.view_w - self.p_left - self.p_right
-        bar_w = w / self.visible_bars
-        return self.p_left + (relative_index + 0.5) * bar_w
+        return self.p_left + (relative_index + 0.5) * self.get_bar_width()
+
+    def indices_to_x(self, count: int) -> np.ndarray:
+        """
+        Vectorized index_to_x for the first 'count' visible bars.
+        
+        Args:
+            count: Number of bars currently in the visible window.
+        """
+        return self.p_left + (np.arange(count, dtype=np.float64) + 0.5) * self.get_bar_width()
 
     def get_bar_width(self) -> float:
         """Returns the width of a single bar in pixels."""
-        w = self.view_w - self.p_left - self.p_right
-        return w / self.visible_bars
+        return self.inner_w / self.visible_bars
@@ -3,16 +3,58 @@ The primary chart pane for rendering price action and overlays.
 """
 
 from typing import Optional, Dict, Any, Tuple, List
+import calendar
 import math
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics, QBrush
-from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPen, QFont, QFontMetrics, QBrush, QPolygonF
+from PySide6.QtCore import Qt, QRectF, QPointF, QLineF
 import pandas as pd
 import numpy as np
 from views.chart.chart_pane import ChartPane
 from models.enums import ChartType
 from models.data_models import TDSequentialSettings, BollingerBandsSettings
 
+# Integer encoding of TD Sequential direction columns ('buy' / 'sell' / None)
+_TD_NONE, _TD_BUY, _TD_SELL = 0, 1, 2
+_TD_LABELS = (None, 'buy', 'sell')
+
+# Month axis labels indexed by month number (index 0 is unused)
+_MONTH_ABBR = tuple(calendar.month_abbr)
+
+# Multipliers of the nearest power of ten considered "nice" axis increments
+_NICE_STEPS = np.array([1.0, 2.0, 5.0, 10.0])
+
+def _compute_price_ticks(min_p: float, max_p: float, h: int) -> Tuple[np.ndarray, int]:
+    """
+    Computes evenly spaced, human-friendly price axis ticks.
+    
+    Args:
+        min_p: Lowest price of the viewport.
+        max_p: Highest price of the viewport.
+        h: Height of the drawable area in pixels.
+        
+    Returns:
+        Tuple of (tick values, decimal precision for their labels).
+    """
+    p_range = max_p - min_p
+    max_ticks = max(1, h // 50)
+    raw_inc = p_range / max_ticks if p_range > 0 else 1
+    p10 = 10 ** math.floor(math.log10(raw_inc)) if raw_inc > 0 else 1
+    candidates = _NICE_STEPS * p10
+    nice_inc = float(candidates[np.argmin(np.abs(candidates - raw_inc))])
+    precision = 0 if nice_inc >= 1 and nice_inc == int(nice_inc) else max(0, math.ceil(-math.log10(nice_inc)))
+    
+    first = math.ceil(min_p / nice_inc) * nice_inc
+    count = int((max_p - first) // nice_inc) + 1 if first <= max_p else 0
+    return first + nice_inc * np.arange(count), precision
+
+def _encode_direction(values: np.ndarray) -> np.ndarray:
+    """Encodes a 'buy'/'sell' object column as a compact int8 array."""
+    codes = np.full(len(values), _TD_NONE, dtype=np.int8)
+    codes[values == 'buy'] = _TD_BUY
+    codes[values == 'sell'] = _TD_SELL
+    return codes
+
 class PricePane(ChartPane):
     """
     Renders Candlesticks, OHLC, or Line charts along with TD Sequential 
@@ -41,6 +83,75 @@ class PricePane(ChartPane):
 
         # Interaction
         self.mouse_pos: Optional[QPointF] = None
+        
+        # Year axis labels; only a handful of years ever occur
+        self._year_label_cache: Dict[int, str] = {}
+        
+        # Per-dataset render arrays (Structure of Arrays), see _cache_arrays
+        self._cache_arrays(None)
+
+    def _cache_arrays(self, df: Optional[pd.DataFrame]):
+        """Extracts every rendered column into a contiguous numpy array."""
+        def col(name: str, dtype=np.float64) -> Optional[np.ndarray]:
+            if df is None or name not in df.columns:
+                return None
+            return np.ascontiguousarray(df[name].to_numpy(dtype=dtype))
+        
+        self._arr_open, self._arr_high = col('Open'), col('High')
+        self._arr_low, self._arr_close = col('Low'), col('Close')
+        self._arr_ha_open, self._arr_ha_high = col('HA_Open'), col('HA_High')
+        self._arr_ha_low, self._arr_ha_close = col('HA_Low'), col('HA_Close')
+        
+        # Bollinger Bands, keyed by standard deviation multiplier
+        self._arr_bb_middle = col('bb_middle')
+        self._arr_bb_upper: Dict[float, np.ndarray] = {}
+        self._arr_bb_lower: Dict[float, np.ndarray] = {}
+        for name in (df.columns if df is not None else []):
+            if name.startswith('bb_upper_'):
+                self._arr_bb_upper[float(name[len('bb_upper_'):])] = col(name)
+            elif name.startswith('bb_lower_'):
+                self._arr_bb_lower[float(name[len('bb_lower_'):])] = col(name)
+        
+        # TD Sequential
+        self._arr_setup_count = col('setup_count', np.int32)
+        self._arr_perfected = col('perfected', np.bool_)
+        self._arr_countdown_count = col('countdown_count')
+        has_td = df is not None and 'setup_type' in df.columns
+        self._arr_setup_type_i8 = _encode_direction(df['setup_type'].to_numpy(dtype=object)) if has_td else None
+        self._arr_countdown_type_i8 = _encode_direction(df['countdown_type'].to_numpy(dtype=object)) if has_td else None
+        
+        # Calendar fields used to place date axis transitions
+        is_dated = df is not None and isinstance(df.index, pd.DatetimeIndex)
+        self._arr_year = df.index.year.to_numpy(dtype=np.int32) if is_dated else None
+        self._arr_month = df.index.month.to_numpy(dtype=np.int32) if is_dated else None
+        self._arr_date_str = df.index.strftime('%Y-%m-%d').to_numpy() if is_dated else None
+
+    def row_data(self, idx: int) -> Dict[str, Any]:
+        """
+        Builds the hover payload for a single bar from the cached arrays.
+        
+        Args:
+            idx: Absolute row index into the current dataset.
+        """
+        data: Dict[str, Any] = {
+            'Date': self._arr_date_str[idx] if self._arr_date_str is not None else str(self.df.index[idx]),
+            'Open': self._arr_open[idx],
+            'High': self._arr_high[idx],
+            'Low': self._arr_low[idx],
+            'Close': self._arr_close[idx],
+        }
+        if self._arr_bb_middle is not None:
+            data['bb_middle'] = self._arr_bb_middle[idx]
+        for std, arr in self._arr_bb_upper.items():
+            data[f'bb_upper_{std}'] = arr[idx]
+        for std, arr in self._arr_bb_lower.items():
+            data[f'bb_lower_{std}'] = arr[idx]
+        if self._arr_setup_count is not None:
+            data['setup_count'] = self._arr_setup_count[idx]
+            data['setup_type'] = _TD_LABELS[self._arr_setup_type_i8[idx]]
+            data['countdown_count'] = self._arr_countdown_count[idx]
+            data['countdown_type'] = _TD_LABELS[self._arr_countdown_type_i8[idx]]
+        return data
 
     def update_fonts(self, font_settings: Any):
         """Updates font objects based on relative settings."""
@@ -76,49 +187,55 @@ class PricePane(ChartPane):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # 1. Prepare Viewport & Data
-        visible_df, start_idx, end_idx = self._get_visible_data()
-        if visible_df.empty: return
+        start_idx, end_idx = self._get_visible_range()
+        if end_idx <= start_idx: return
         
-        self._calculate_ranges(visible_df)
+        self._calculate_ranges(start_idx, end_idx)
         self._update_mapper()
+        xs = self.mapper.indices_to_x(end_idx - start_idx)
         
         # 2. Background
-        painter.fillRect(self.rect(), QColor(self.theme.get("chart_bg", "#1e1e1e")))
+        painter.fillRect(self.rect(), self._color("chart_bg", "#1e1e1e"))
         
         # 3. Grid & Axis
-        self._draw_grid(painter, visible_df, start_idx, end_idx)
+        self._draw_grid(painter, xs, start_idx, end_idx)
         
         # 4. Overlays (Background Layer)
         if self.show_bb:
-            self._draw_bollinger_bands(painter, visible_df)
+            self._draw_bollinger_bands(painter, xs, start_idx, end_idx)
             
         # 5. Main Price Series
-        self._draw_price_series(painter, visible_df)
+        self._draw_price_series(painter, xs, start_idx, end_idx)
         
         # 6. Overlays (Foreground Layer)
         if self.show_td:
-            self._draw_td_sequential(painter, visible_df)
+            self._draw_td_sequential(painter, xs, start_idx, end_idx)
             
         # 7. Metadata & UI Overlays
         self._draw_header(painter)
         if self.mouse_pos:
             self._draw_crosshairs(painter)
 
-    def _calculate_ranges(self, visible_df: pd.DataFrame):
+    def _calculate_ranges(self, start_idx: int, end_idx: int):
         """Finds min/max prices to fit the viewport."""
+        sl = slice(start_idx, end_idx)
         if self.chart_type == ChartType.HEIKEN_ASHI:
-            min_p, max_p = visible_df['HA_Low'].min(), visible_df['HA_High'].max()
+            cols = [self._arr_ha_low[sl], self._arr_ha_high[sl]]
         elif self.chart_type == ChartType.LINE:
-            min_p, max_p = visible_df['Close'].min(), visible_df['Close'].max()
+            cols = [self._arr_close[sl]]
         else:
-            min_p, max_p = visible_df['Low'].min(), visible_df['High'].max()
+            cols = [self._arr_low[sl], self._arr_high[sl]]
             
         if self.show_bb:
             for std in self.bb_std_devs:
-                if f'bb_upper_{std}' in visible_df.columns:
-                    max_p = max(max_p, visible_df[f'bb_upper_{std}'].max())
-                if f'bb_lower_{std}' in visible_df.columns:
-                    min_p = min(min_p, visible_df[f'bb_lower_{std}'].min())
+                if std in self._arr_bb_upper:
+                    cols.append(self._arr_bb_upper[std][sl])
+                if std in self._arr_bb_lower:
+                    cols.append(self._arr_bb_lower[std][sl])
+        
+        # One pass over a single block; nan-aware to skip the bands' warm-up period
+        stacked = np.vstack(cols)
+        min_p, max_p = float(np.nanmin(stacked)), float(np.nanmax(stacked))
                     
         buf = (max_p - min_p) * 0.1 if max_p != min_p else 1.0
         self.min_p, self.max_p = min_p - buf, max_p + buf
@@ -132,128 +249,148 @@ class PricePane(ChartPane):
         self.mapper.update_view_dims(self.width(), self.height(), p_top, p_bottom, 10, p_right)
         self.mapper.update_data_range(self.min_p, self.max_p, self.visible_bars, self.scroll_offset)
 
-    def _draw_grid(self, painter: QPainter, visible_df, start_idx, end_idx):
-        painter.setPen(QPen(QColor(self.theme.get("grid", "#3c3c3c")), 1))
+    def _draw_grid(self, painter: QPainter, xs: np.ndarray, start_idx, end_idx):
+        painter.setPen(QPen(self._color("grid", "#3c3c3c"), 1))
         painter.setFont(self.font_labels)
         
         # Vertical Price Axis
-        h = self.height() - self.mapper.p_top - self.mapper.p_bottom
-        p_range = self.max_p - self.min_p
-        max_ticks = max(1, h // 50)
-        raw_inc = p_range / max_ticks if p_range > 0 else 1
-        p10 = 10 ** math.floor(math.log10(raw_inc)) if raw_inc > 0 else 1
-        nice_inc = min([p10, 2*p10, 5*p10, 10*p10], key=lambda x: abs(x - raw_inc))
-        precision = 0 if nice_inc >= 1 and nice_inc == int(nice_inc) else max(0, math.ceil(-math.log10(nice_inc)))
-        
-        curr_tick = math.ceil(self.min_p / nice_inc) * nice_inc
-        while curr_tick <= self.max_p:
-            y = self.mapper.price_to_y(curr_tick)
-            painter.setPen(QPen(QColor(self.theme.get("grid", "#3c3c3c")), 1))
-            painter.drawLine(self.mapper.p_left, int(y), self.width() - self.mapper.p_right, int(y))
-            painter.setPen(QColor(self.theme.get("text_label", "#808080")))
-            painter.drawText(self.width() - self.mapper.p_right + 5, int(y + 5), f"{curr_tick:.{precision}f}")
-            curr_tick += nice_inc
+        m = self.mapper
+        ticks, precision = _compute_price_ticks(self.min_p, self.max_p, m.inner_h)
+        # Grid lines are axis-aligned, so snap all rows to whole pixels in one pass
+        ys = np.rint(m.prices_to_y(ticks)).astype(np.int32)
+        
+        for tick, y in zip(ticks.tolist(), ys.tolist()):
+            painter.setPen(QPen(self._color("grid", "#3c3c3c"), 1))
+            painter.drawLine(m.p_left, y, m.x_right, y)
+            painter.setPen(self._color("text_label", "#808080"))
+            painter.drawText(m.x_right + 5, y + 5, f"{tick:.{precision}f}")
 
         # Horizontal Date Axis
+        if self._arr_year is None: return
+        # Plain ints: cheaper comparisons and a uniform key type for the label cache
+        years = self._arr_year[start_idx:end_idx].tolist()
+        months = self._arr_month[start_idx:end_idx].tolist()
         last_year, last_month = -1, -1
-        for i, idx in enumerate(range(start_idx, end_idx)):
-            d = self.df.index[idx]
-            if d.year != last_year or d.month != last_month:
-                x = self.mapper.index_to_x(i)
-                painter.setPen(QPen(QColor(self.theme.get("grid", "#3c3c3c")), 1))
-                painter.drawLine(int(x), self.mapper.p_top, int(x), self.height() - self.mapper.p_bottom)
-                is_year = d.year != last_year
-                painter.setPen(QColor(self.theme.get("text_main" if is_year else "text_label", "#ffffff")))
-                painter.drawText(int(x - 15), int(self.height() - self.mapper.p_bottom + 15), d.strftime('%Y' if is_year else '%b'))
-                last_year, last_month = d.year, d.month
+        for i in range(end_idx - start_idx):
+            year, month = years[i], months[i]
+            if year != last_year or month != last_month:
+                x = xs[i]
+                painter.setPen(QPen(self._color("grid", "#3c3c3c"), 1))
+                painter.drawLine(int(x), m.p_top, int(x), m.y_bottom)
+                is_year = year != last_year
+                if is_year:
+                    label = self._year_label_cache.get(year)
+                    if label is None:
+                        label = self._year_label_cache[year] = str(year)
+                else:
+                    label = _MONTH_ABBR[month]
+                painter.setPen(self._color("text_main" if is_year else "text_label", "#ffffff"))
+                painter.drawText(int(x - 15), int(m.y_bottom + 15), label)
+                last_year, last_month = year, month
 
-    def _draw_price_series(self, painter: QPainter, visible_df):
+    def _draw_price_series(self, painter: QPainter, xs: np.ndarray, start_idx: int, end_idx: int):
         bw = self.mapper.get_bar_width()
-        is_ha = self.chart_type == ChartType.HEIKEN_ASHI
-        opens = visible_df['HA_Open' if is_ha else 'Open'].values
-        highs = visible_df['HA_High' if is_ha else 'High'].values
-        lows = visible_df['HA_Low' if is_ha else 'Low'].values
-        closes = visible_df['HA_Close' if is_ha else 'Close'].values
+        sl = slice(start_idx, end_idx)
+        if self.chart_type == ChartType.HEIKEN_ASHI:
+            opens, highs = self._arr_ha_open[sl], self._arr_ha_high[sl]
+            lows, closes = self._arr_ha_low[sl], self._arr_ha_close[sl]
+        else:
+            opens, highs = self._arr_open[sl], self._arr_high[sl]
+            lows, closes = self._arr_low[sl], self._arr_close[sl]
         
         if self.chart_type == ChartType.LINE:
-            painter.setPen(QPen(QColor(self.theme.get("cd_buy", "#00ffff")), 2))
-            for i in range(len(visible_df) - 1):
-                p1 = QPointF(self.mapper.index_to_x(i), self.mapper.price_to_y(closes[i]))
-                p2 = QPointF(self.mapper.index_to_x(i+1), self.mapper.price_to_y(closes[i+1]))
-                painter.drawLine(p1, p2)
+            # One polyline call renders every segment of the close series
+            ys = self.mapper.prices_to_y(closes)
+            painter.setPen(QPen(self._color("cd_buy", "#00ffff"), 2))
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
         else:
-            for i in range(len(visible_df)):
-                x = self.mapper.index_to_x(i)
-                color = QColor(self.theme.get("bull" if closes[i] >= opens[i] else "bear", "#00c800"))
+            # Vectorized pixel mapping and bull/bear partitioning
+            yh, yl = self.mapper.prices_to_y(highs), self.mapper.prices_to_y(lows)
+            yo, yc = self.mapper.prices_to_y(opens), self.mapper.prices_to_y(closes)
+            body_top = np.minimum(yo, yc)
+            body_h = np.maximum(1.0, np.abs(yo - yc))
+            is_bull = closes >= opens
+            
+            # Each color group is submitted in one batched draw call per primitive
+            for color_key, idx in (("bull", np.flatnonzero(is_bull)), ("bear", np.flatnonzero(~is_bull))):
+                if idx.size == 0:
+                    continue
+                color = self._color(color_key, "#00c800")
                 painter.setPen(QPen(color, 1))
                 painter.setBrush(color)
                 
-                yh, yl = self.mapper.price_to_y(highs[i]), self.mapper.price_to_y(lows[i])
-                yo, yc = self.mapper.price_to_y(opens[i]), self.mapper.price_to_y(closes[i])
+                gx = xs[idx].tolist()
+                wicks = [QLineF(x, h, x, l) for x, h, l in zip(gx, yh[idx].tolist(), yl[idx].tolist())]
                 
                 if self.chart_type == ChartType.OHLC:
-                    painter.drawLine(QPointF(x, yh), QPointF(x, yl))
-                    painter.drawLine(QPointF(x - bw * 0.3, yo), QPointF(x, yo))
-                    painter.drawLine(QPointF(x, yc), QPointF(x + bw * 0.3, yc))
+                    wicks += [QLineF(x - bw * 0.3, y, x, y) for x, y in zip(gx, yo[idx].tolist())]
+                    wicks += [QLineF(x, y, x + bw * 0.3, y) for x, y in zip(gx, yc[idx].tolist())]
+                    painter.drawLines(wicks)
                 else:
-                    painter.drawLine(QPointF(x, yh), QPointF(x, yl))
-                    painter.drawRect(QRectF(x - bw * 0.35, min(yo, yc), bw * 0.7, max(1, abs(yo - yc))))
+                    painter.drawLines(wicks)
+                    painter.drawRects([QRectF(x - bw * 0.35, t, bw * 0.7, bh)
+                                       for x, t, bh in zip(gx, body_top[idx].tolist(), body_h[idx].tolist())])
 
-    def _draw_bollinger_bands(self, painter: QPainter, visible_df):
-        if 'bb_middle' not in visible_df.columns: return
+    def _draw_bollinger_bands(self, painter: QPainter, xs: np.ndarray, start_idx: int, end_idx: int):
+        if self._arr_bb_middle is None: return
+        n = end_idx - start_idx
         
         # Middle
-        painter.setPen(QPen(QColor(self.theme.get("bb_mid", "#ffaa00")), 1, Qt.DashLine))
-        for i in range(len(visible_df) - 1):
-            v1, v2 = visible_df['bb_middle'].iloc[i], visible_df['bb_middle'].iloc[i+1]
+        painter.setPen(QPen(self._color("bb_mid", "#ffaa00"), 1, Qt.DashLine))
+        mids = self._arr_bb_middle[start_idx:end_idx]
+        for i in range(n - 1):
+            v1, v2 = mids[i], mids[i+1]
             if not np.isnan(v1) and not np.isnan(v2):
-                painter.drawLine(QPointF(self.mapper.index_to_x(i), self.mapper.price_to_y(v1)),
-                                 QPointF(self.mapper.index_to_x(i+1), self.mapper.price_to_y(v2)))
+                painter.drawLine(QPointF(xs[i], self.mapper.price_to_y(v1)),
+                                 QPointF(xs[i+1], self.mapper.price_to_y(v2)))
         
         # Upper/Lower
         for std in self.bb_std_devs:
-            for suffix, col_key in [('upper', 'bb_upper'), ('lower', 'bb_lower')]:
-                col = f"{col_key}_{std}"
-                if col in visible_df.columns:
-                    painter.setPen(QPen(QColor(self.theme.get(f"bb_{suffix}", "#00aaff")), 1))
-                    for i in range(len(visible_df) - 1):
-                        v1, v2 = visible_df[col].iloc[i], visible_df[col].iloc[i+1]
+            for suffix, bands in [('upper', self._arr_bb_upper), ('lower', self._arr_bb_lower)]:
+                if std in bands:
+                    painter.setPen(QPen(self._color(f"bb_{suffix}", "#00aaff"), 1))
+                    vals = bands[std][start_idx:end_idx]
+                    for i in range(n - 1):
+                        v1, v2 = vals[i], vals[i+1]
                         if not np.isnan(v1) and not np.isnan(v2):
-                            painter.drawLine(QPointF(self.mapper.index_to_x(i), self.mapper.price_to_y(v1)),
-                                             QPointF(self.mapper.index_to_x(i+1), self.mapper.price_to_y(v2)))
+                            painter.drawLine(QPointF(xs[i], self.mapper.price_to_y(v1)),
+                                             QPointF(xs[i+1], self.mapper.price_to_y(v2)))
 
-    def _draw_td_sequential(self, painter: QPainter, visible_df):
-        scs = visible_df['setup_count'].values
-        sts = visible_df['setup_type'].values
-        perfs = visible_df['perfected'].values
-        ccs = visible_df['countdown_count'].values
-        cts = visible_df['countdown_type'].values
-        rhs, rls = visible_df['High'].values, visible_df['Low'].values
-        
-        for i in range(len(visible_df)):
-            x = self.mapper.index_to_x(i)
+    def _draw_td_sequential(self, painter: QPainter, xs: np.ndarray, start_idx: int, end_idx: int):
+        if self._arr_setup_count is None: return
+        sl = slice(start_idx, end_idx)
+        scs = self._arr_setup_count[sl]
+        sts = self._arr_setup_type_i8[sl]
+        perfs = self._arr_perfected[sl]
+        ccs = self._arr_countdown_count[sl]
+        cts = self._arr_countdown_type_i8[sl]
+        rhs, rls = self._arr_high[sl], self._arr_low[sl]
+        c_perf = self._color("perfected", "#ff00ff")
+        c_setup_buy = self._color("setup_buy", "#00ff00")
+        c_setup_sell = self._color("setup_sell", "#00ff00")
+        c_cd_buy = self._color("cd_buy", "#00ffff")
+        c_cd_sell = self._color("cd_sell", "#00ffff")
+        
+        for i in range(end_idx - start_idx):
+            x = xs[i]
             yhr, ylr = self.mapper.price_to_y(rhs[i]), self.mapper.price_to_y(rls[i])
             
             if scs[i] > 0:
                 painter.setFont(self.font_td_setup)
-                color = self.theme.get("perfected", "#ff00ff") if perfs[i] else \
-                        self.theme.get("setup_buy" if sts[i] == 'buy' else "setup_sell", "#00ff00")
-                painter.setPen(QColor(color))
-                painter.drawText(QRectF(x - 10, (ylr + 5 if sts[i] == 'buy' else yhr - 20), 20, 15), Qt.AlignCenter, str(scs[i]))
+                painter.setPen(c_perf if perfs[i] else (c_setup_buy if sts[i] == _TD_BUY else c_setup_sell))
+                painter.drawText(QRectF(x - 10, (ylr + 5 if sts[i] == _TD_BUY else yhr - 20), 20, 15), Qt.AlignCenter, str(scs[i]))
             
             if ccs[i] > 0:
                 painter.setFont(self.font_td_cd)
-                color = self.theme.get("cd_buy" if cts[i] == 'buy' else "cd_sell", "#00ffff")
-                painter.setPen(QColor(color))
-                painter.drawText(QRectF(x - 15, (ylr + 20 if cts[i] == 'buy' else yhr - 40), 30, 20), 
+                painter.setPen(c_cd_buy if cts[i] == _TD_BUY else c_cd_sell)
+                painter.drawText(QRectF(x - 15, (ylr + 20 if cts[i] == _TD_BUY else yhr - 40), 30, 20), 
                                  Qt.AlignCenter, "13+" if ccs[i] == 12.5 else str(int(ccs[i])))
 
     def _draw_header(self, painter: QPainter):
         if self.df is None or self.df.empty:
             return
             
-        last_row = self.df.iloc[-1]
-        painter.setPen(QColor(self.theme.get("text_main", "#ffffff")))
+        painter.setPen(self._color("text_main", "#ffffff"))
         painter.setFont(self.font_main)
         
         # Main Header with Interval
@@ -275,7 +412,7 @@ class PricePane(ChartPane):
         y_pos = 45
         
         # OHLC Latest
-        o, h, l, c = last_row['Open'], last_row['High'], last_row['Low'], last_row['Close']
+        o, h, l, c = self._arr_open[-1], self._arr_high[-1], self._arr_low[-1], self._arr_close[-1]
         is_bull = c >= o
         
         for label, val, color_key in [
@@ -284,110 +421,112 @@ class PricePane(ChartPane):
             ("L", l, "bear"),
             ("C", c, "bull" if is_bull else "bear")
         ]:
-            painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+            painter.setPen(self._color("text_label", "#808080"))
             painter.drawText(curr_x, y_pos, label)
             curr_x += self.fm_labels.horizontalAdvance(label) + 4
             
-            painter.setPen(QColor(self.theme.get(color_key, "#ffffff")))
+            painter.setPen(self._color(color_key, "#ffffff"))
             val_txt = f"{val:.2f}  "
             painter.drawText(curr_x, y_pos, val_txt)
             curr_x += self.fm_labels.horizontalAdvance(val_txt)
 
         if self.show_bb or self.show_td:
-            painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+            painter.setPen(self._color("text_label", "#808080"))
             painter.drawText(curr_x, y_pos, "• ")
             curr_x += self.fm_labels.horizontalAdvance("• ")
         
         if self.show_bb:
-            painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+            painter.setPen(self._color("text_label", "#808080"))
             bb_hdr = f"BB({self.bb_settings.period}) "
             painter.drawText(curr_x, y_pos, bb_hdr)
             curr_x += self.fm_labels.horizontalAdvance(bb_hdr)
             
             # Basis/Mid
-            val = last_row.get('bb_middle', np.nan)
+            val = self._arr_bb_middle[-1] if self._arr_bb_middle is not None else np.nan
             if not np.isnan(val):
-                painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+                painter.setPen(self._color("text_label", "#808080"))
                 painter.drawText(curr_x, y_pos, "M")
                 curr_x += self.fm_labels.horizontalAdvance("M") + 4
-                painter.setPen(QColor(self.theme.get("bb_mid", "#ffffff")))
+                painter.setPen(self._color("bb_mid", "#ffffff"))
                 txt = f"{val:.2f}  "
                 painter.drawText(curr_x, y_pos, txt)
                 curr_x += self.fm_labels.horizontalAdvance(txt)
             
             # Bands
             for std in self.bb_std_devs:
-                u_val = last_row.get(f'bb_upper_{std}', np.nan)
+                u_val = self._arr_bb_upper[std][-1] if std in self._arr_bb_upper else np.nan
                 if not np.isnan(u_val):
-                    painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+                    painter.setPen(self._color("text_label", "#808080"))
                     u_lbl = f"U({int(std) if std == int(std) else std})"
                     painter.drawText(curr_x, y_pos, u_lbl)
                     curr_x += self.fm_labels.horizontalAdvance(u_lbl) + 4
-                    painter.setPen(QColor(self.theme.get("bb_upper", "#ffffff")))
+                    painter.setPen(self._color("bb_upper", "#ffffff"))
                     txt = f"{u_val:.2f}  "
                     painter.drawText(curr_x, y_pos, txt)
                     curr_x += self.fm_labels.horizontalAdvance(txt)
                 
-                l_val = last_row.get(f'bb_lower_{std}', np.nan)
+                l_val = self._arr_bb_lower[std][-1] if std in self._arr_bb_lower else np.nan
                 if not np.isnan(l_val):
-                    painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+                    painter.setPen(self._color("text_label", "#808080"))
                     l_lbl = f"L({int(std) if std == int(std) else std})"
                     painter.drawText(curr_x, y_pos, l_lbl)
                     curr_x += self.fm_labels.horizontalAdvance(l_lbl) + 4
-                    painter.setPen(QColor(self.theme.get("bb_lower", "#ffffff")))
+                    painter.setPen(self._color("bb_lower", "#ffffff"))
                     txt = f"{l_val:.2f}  "
                     painter.drawText(curr_x, y_pos, txt)
                     curr_x += self.fm_labels.horizontalAdvance(txt)
             
             if self.show_td:
-                painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+                painter.setPen(self._color("text_label", "#808080"))
                 painter.drawText(curr_x, y_pos, "• ")
                 curr_x += self.fm_labels.horizontalAdvance("• ")
 
         if self.show_td:
-            painter.setPen(QColor(self.theme.get("text_label", "#808080")))
+            painter.setPen(self._color("text_label", "#808080"))
             painter.drawText(curr_x, y_pos, "TD ")
             curr_x += self.fm_labels.horizontalAdvance("TD ")
             
-            s_count = last_row.get('setup_count', 0)
-            s_type = last_row.get('setup_type')
+            has_td = self._arr_setup_count is not None
+            s_count = self._arr_setup_count[-1] if has_td else 0
+            s_type = self._arr_setup_type_i8[-1] if has_td else _TD_NONE
             if s_count > 0:
-                painter.setPen(QColor(self.theme.get("text_label", "#808080")))
-                s_lbl = f"S({'B' if s_type == 'buy' else 'S'})"
+                painter.setPen(self._color("text_label", "#808080"))
+                s_lbl = f"S({'B' if s_type == _TD_BUY else 'S'})"
                 painter.drawText(curr_x, y_pos, s_lbl)
                 curr_x += self.fm_labels.horizontalAdvance(s_lbl) + 4
                 
-                color_key = "setup_buy" if s_type == 'buy' else "setup_sell"
-                painter.setPen(QColor(self.theme.get(color_key, "#ffffff")))
+                color_key = "setup_buy" if s_type == _TD_BUY else "setup_sell"
+                painter.setPen(self._color(color_key, "#ffffff"))
                 txt = f"{int(s_count)}  "
                 painter.drawText(curr_x, y_pos, txt)
                 curr_x += self.fm_labels.horizontalAdvance(txt)
                 
-            c_count = last_row.get('countdown_count', 0)
-            c_type = last_row.get('countdown_type')
+            c_count = self._arr_countdown_count[-1] if has_td else 0
+            c_type = self._arr_countdown_type_i8[-1] if has_td else _TD_NONE
             if c_count > 0:
-                painter.setPen(QColor(self.theme.get("text_label", "#808080")))
-                c_lbl = f"C({'B' if c_type == 'buy' else 'S'})"
+                painter.setPen(self._color("text_label", "#808080"))
+                c_lbl = f"C({'B' if c_type == _TD_BUY else 'S'})"
                 painter.drawText(curr_x, y_pos, c_lbl)
                 curr_x += self.fm_labels.horizontalAdvance(c_lbl) + 4
                 
                 disp_c = "13+" if c_count == 12.5 else str(int(c_count))
-                color_key = "cd_buy" if c_type == 'buy' else "cd_sell"
-                painter.setPen(QColor(self.theme.get(color_key, "#ffffff")))
+                color_key = "cd_buy" if c_type == _TD_BUY else "cd_sell"
+                painter.setPen(self._color(color_key, "#ffffff"))
                 txt = f"{disp_c}  "
                 painter.drawText(curr_x, y_pos, txt)
                 curr_x += self.fm_labels.horizontalAdvance(txt)
 
     def _draw_crosshairs(self, painter: QPainter):
+        m = self.mapper
         x = self.mouse_pos.x()
-        if self.mapper.p_left <= x <= self.width() - self.mapper.p_right:
-            bw = self.mapper.get_bar_width()
-            idx_rel = int((x - self.mapper.p_left) / bw)
+        if m.p_left <= x <= m.x_right:
+            bw = m.get_bar_width()
+            idx_rel = int((x - m.p_left) / bw)
             idx_act = max(0, len(self.df) - self.scroll_offset - self.visible_bars) + idx_rel
             
             if 0 <= idx_act < len(self.df):
-                sx = self.mapper.index_to_x(idx_rel)
-                sy = self.mapper.price_to_y(self.df['Close'].iloc[idx_act])
-                painter.setPen(QPen(QColor(self.theme.get("crosshair", "#969696")), 1, Qt.DashLine))
-                painter.drawLine(QPointF(sx, self.mapper.p_top), QPointF(sx, self.height() - self.mapper.p_bottom))
-                painter.drawLine(QPointF(self.mapper.p_left, sy), QPointF(self.width() - self.mapper.p_right, sy))
\ No newline at end of file
+                sx = m.index_to_x(idx_rel)
+                sy = m.price_to_y(self._arr_close[idx_act])
+                painter.setPen(QPen(self._color("crosshair", "#969696"), 1, Qt.DashLine))
+                painter.drawLine(QPointF(sx, m.p_top), QPointF(sx, m.y_bottom))
+                painter.drawLine(QPointF(m.p_left, sy), QPointF(m.x_right, sy))
\ No newline at end of file
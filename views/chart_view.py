@@ -5,10 +5,11 @@ Master container for the multi-pane charting engine.
 from typing import Optional, Dict, Any, List, Tuple
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPinchGesture, QGestureEvent, QApplication
 from PySide6.QtGui import QPainter, QColor, QMouseEvent, QWheelEvent
-from PySide6.QtCore import Qt, QPointF, Signal, QEvent, QSize
+from PySide6.QtCore import Qt, QPointF, Signal, QEvent, QSize, QTimer
 import pandas as pd
 
 from views.chart.price_pane import PricePane
+from views.themes import Theme
 from models.enums import ChartType
 
 class CandlestickChart(QWidget):
@@ -32,6 +33,10 @@ class CandlestickChart(QWidget):
         self.scroll_offset = 0
         self.last_mouse_pos: Optional[QPointF] = None
         
+        # Hover state used to skip redundant status updates
+        self._last_hover_idx = -1
+        self._last_hover_df: Optional[pd.DataFrame] = None
+        
         # Child Panes
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -46,6 +51,12 @@ class CandlestickChart(QWidget):
         # 2. Add it to this layout: self.layout.addWidget(rsi_pane, stretch=0).
         # 3. Ensure it is updated in set_data() and event handlers.
 
+        # Coalesces crosshair repaints to at most one per display frame (~60 Hz)
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.price_pane.update)
+
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
         self.grabGesture(Qt.GestureType.PinchGesture)
@@ -60,7 +71,7 @@ class CandlestickChart(QWidget):
         self.price_pane.metadata = metadata
         self._sync_panes()
 
-    def apply_theme(self, theme: Dict[str, str]):
+    def apply_theme(self, theme: Theme):
         """Propagates theme to all child panes."""
         self.price_pane.apply_theme(theme)
 
@@ -100,7 +111,8 @@ class CandlestickChart(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent):
         # 1. Update Crosshairs for all panes
         self.price_pane.mouse_pos = event.pos()
-        self.price_pane.update()
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
         
         # 2. Emit hovered data to controller
         self._emit_hover_data(event.pos())
@@ -109,7 +121,7 @@ class CandlestickChart(QWidget):
         if self.last_mouse_pos and self.df is not None:
             # Use price_pane's mapper for coordinate logic
             mapper = self.price_pane.mapper
-            inner_w = mapper.view_w - mapper.p_left - mapper.p_right
+            inner_w = mapper.inner_w
             if inner_w > 0:
                 shift = int((event.pos().x() - self.last_mouse_pos.x()) * (self.visible_bars / inner_w))
                 if shift != 0:
@@ -123,22 +135,30 @@ class CandlestickChart(QWidget):
 
     def leaveEvent(self, event: QEvent):
         self.price_pane.mouse_pos = None
+        self._last_hover_idx = -1
         self.hovered_data_changed.emit(None)
         self.update()
 
     def _emit_hover_data(self, pos: QPointF):
         if self.df is None or self.df.empty: return
         mapper = self.price_pane.mapper
-        if mapper.p_left <= pos.x() <= self.width() - mapper.p_right:
+        idx_act = -1
+        if mapper.p_left <= pos.x() <= mapper.x_right:
             idx_rel = int((pos.x() - mapper.p_left) / mapper.get_bar_width())
             idx_act = max(0, len(self.df) - self.scroll_offset - self.visible_bars) + idx_rel
-            if 0 <= idx_act < len(self.df):
-                r = self.df.iloc[idx_act]
-                data = r.to_dict()
-                data['Date'] = self.df.index[idx_act].strftime('%Y-%m-%d')
-                self.hovered_data_changed.emit(data)
-                return
-        self.hovered_data_changed.emit(None)
+            if not 0 <= idx_act < len(self.df):
+                idx_act = -1
+        
+        # Moving within the same bar of the same dataset leaves the status unchanged
+        if idx_act == self._last_hover_idx and self.df is self._last_hover_df:
+            return
+        self._last_hover_idx = idx_act
+        self._last_hover_df = self.df
+        
+        if idx_act >= 0:
+            self.hovered_data_changed.emit(self.price_pane.row_data(idx_act))
+        else:
+            self.hovered_data_changed.emit(None)
 
     def sizeHint(self) -> QSize:
         return QSize(800, 600)
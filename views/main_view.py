@@ -6,13 +6,16 @@ the interactive Chart, the Sidebar settings panel, and the Status Bar.
 """
 
 from typing import Optional, Dict, Any, List
-from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QLineEdit, QSplitter, QStatusBar, QToolBar, QSizePolicy, QLabel, QComboBox)
-from PySide6.QtGui import QAction, QIcon
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtWidgets import (QMainWindow, QWidget, QSplitter, QStatusBar, QToolBar, 
+                             QSizePolicy, QLabel, QComboBox)
+from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, Signal, QSize, Slot, QSignalBlocker
 from views.chart_view import CandlestickChart
 from views.sidebar_view import SidebarView
-from views.themes import THEMES
+from views.themes import THEMES, Theme
+
+# Alignment flag combination resolved once at import
+_ALIGN_RIGHT_V = Qt.AlignRight | Qt.AlignVCenter
 
 
 class MainView(QMainWindow):
@@ -26,6 +29,9 @@ class MainView(QMainWindow):
     sidebar_toggled = Signal()
     tooltips_toggled = Signal(bool)
     theme_requested = Signal(str)
+    
+    # Composed stylesheet per theme
+    _qss_cache: Dict[Theme, str] = {}
 
     def __init__(self):
         super().__init__()
@@ -36,14 +42,22 @@ class MainView(QMainWindow):
         # Optimize toolbar for macOS native appearance
         self.setUnifiedTitleAndToolBarOnMac(True)
         
-        self._init_ui()
-        self._init_menu()
+        # Build the widget tree with painting suspended so it lays out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._init_ui()
+            self._init_menu()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _init_ui(self):
         """Initializes the central layout and primary widgets."""
         
         # --- 1. Toolbar Configuration ---
         self.toolbar = QToolBar("Main Toolbar")
+        # Populate with layout and change notifications held back; one pass at the end
+        self.toolbar.setUpdatesEnabled(False)
+        toolbar_blocker = QSignalBlocker(self.toolbar)
         self.toolbar.setMovable(False)
         self.toolbar.setFloatable(False)
         self.toolbar.setIconSize(QSize(16, 16))
@@ -59,9 +73,12 @@ class MainView(QMainWindow):
         
         self.toolbar.addSeparator()
 
+        # Both spacers share one policy so the input field area stays centered
+        spacer_policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
         # Left spacer to center the input field area
         spacer_left = QWidget()
-        spacer_left.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        spacer_left.setSizePolicy(spacer_policy)
         self.toolbar.addWidget(spacer_left)
 
         # Ticker Input Field (Editable ComboBox for Recent Symbols)
@@ -85,8 +102,10 @@ class MainView(QMainWindow):
 
         # Right spacer
         spacer_right = QWidget()
-        spacer_right.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        spacer_right.setSizePolicy(spacer_policy)
         self.toolbar.addWidget(spacer_right)
+        toolbar_blocker.unblock()
+        self.toolbar.setUpdatesEnabled(True)
 
         # --- 2. Central Area (Splitter for resizing Chart/Sidebar) ---
         self.splitter = QSplitter(Qt.Horizontal)
@@ -110,15 +129,20 @@ class MainView(QMainWindow):
         
         # HTML-enabled label for detailed OHLC data display
         self.status_lbl_widget = QLabel("Ready")
-        self.status_lbl_widget.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self.status_lbl_widget.setObjectName("statusLbl")
+        self.status_lbl_widget.setAlignment(_ALIGN_RIGHT_V)
+        # Content is always HTML; fixing the format skips rich-text detection on each hover update
+        self.status_lbl_widget.setTextFormat(Qt.RichText)
         self.status_lbl_widget.setStyleSheet("padding: 0 10px;")
         # Permanent widgets in status bar persist even when temporary messages are shown
         self.status_bar.addPermanentWidget(self.status_lbl_widget, 1)
 
+    @Slot()
     def _on_load_clicked(self):
         """Helper to collect text and emit a request to load a ticker."""
         self.load_requested.emit(self.symbol_input.currentText())
 
+    @Slot()
     def _on_search_clicked(self):
         """Helper to collect text and emit a request to search for a ticker."""
         self.search_requested.emit(self.symbol_input.currentText())
@@ -152,15 +176,26 @@ class MainView(QMainWindow):
         
         # Dynamic theme selection menu
         self.theme_menu = self.view_menu.addMenu("Color Scheme")
-        for theme_name in THEMES.keys():
-            action = self.theme_menu.addAction(theme_name)
-            # Use a lambda to capture the theme name for the signal
-            action.triggered.connect(lambda checked=False, name=theme_name: self.theme_requested.emit(name))
-
+        theme_actions = [QAction(theme_name, self) for theme_name in THEMES]
+        for theme_name, action in zip(THEMES, theme_actions):
+            # The theme name travels as the action's payload; all actions share one slot
+            action.setData(theme_name)
+            action.triggered.connect(self._on_theme_action_triggered)
+        self.theme_menu.addActions(theme_actions)
+
+    @Slot()
+    def _on_theme_action_triggered(self):
+        """Emits the theme request carried by the triggering menu action."""
+        action = self.sender()
+        if action is not None:
+            self.theme_requested.emit(action.data())
+
+    @Slot(str)
     def update_status_bar(self, html_text: str):
         """Updates the persistent OHLC label in the status bar."""
         self.status_lbl_widget.setText(html_text)
 
+    @Slot(bool)
     def set_loading_state(self, is_loading: bool):
         """Disables inputs and shows a message during network operations."""
         self.load_action.setEnabled(not is_loading)
@@ -173,18 +208,26 @@ class MainView(QMainWindow):
         else:
             self.status_bar.clearMessage()
 
-    def apply_theme_styles(self, theme: Dict[str, str]):
+    @Slot(object)
+    def apply_theme_styles(self, theme: Theme):
         """Applies global color definitions from the theme to the UI layout."""
+        qss = self._qss_cache.get(theme)
+        if qss is None:
+            window_bg, text_main = theme.window_bg, theme.text_main
+            status_bg, status_text = theme.status_bg, theme.status_text
+            # A single window-level sheet: Qt parses and polishes the tree once
+            qss = self._qss_cache[theme] = (
+                # Main window background
+                f"QMainWindow {{ background-color: {window_bg}; color: {text_main}; }}\n"
+                # Status bar components
+                f"QStatusBar {{ background-color: {status_bg}; color: {status_text}; }}\n"
+                f"QLabel#statusLbl {{ color: {status_text}; }}"
+            )
         
-        # Set main window background
-        self.setStyleSheet(f"QMainWindow {{ background-color: {theme['window_bg']}; color: {theme['text_main']}; }}")
-        
-        # Style the status bar components
-        self.status_bar.setStyleSheet(
-            f"QStatusBar {{ background-color: {theme['status_bg']}; color: {theme['status_text']}; }}"
-        )
-        self.status_lbl_widget.setStyleSheet(f"color: {theme['status_text']};")
+        # Re-applying an identical sheet would still re-polish the whole tree
+        if self.styleSheet() != qss:
+            self.setStyleSheet(qss)
 
         # Propagate theme settings to specialized child views
         self.sidebar.apply_theme_styles(theme)
-        self.chart.apply_theme(theme)
\ No newline at end of file
+        self.chart.apply_theme(theme)
@@ -5,16 +5,35 @@ Provides a selection interface when the user enters an ambiguous
 or incorrect ticker symbol.
 """
 
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QListWidget, 
-                             QDialogButtonBox, QLabel, QListWidgetItem, QWidget)
+                             QDialogButtonBox, QLabel, QWidget)
 from PySide6.QtCore import Qt
 
+# Enum values resolved once instead of on every row / dialog construction
+_USER_ROLE = Qt.UserRole
+_OK_CANCEL = QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+
+# Number of recently shown result sets whose dialogs are kept alive for reuse
+_DIALOG_CACHE_SIZE = 8
+
+
+def _display_fields(item: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Returns the (symbol, name, exchange, type) shown for one search result."""
+    return (item.get('symbol', 'Unknown'),
+            item.get('shortname') or item.get('longname', ''),
+            item.get('exchange', ''),
+            item.get('typeDisp', ''))
+
 class SymbolSearchDialog(QDialog):
     """
     A modal dialog that presents a list of suggested symbols from Yahoo Finance.
     """
     
+    # LRU of built dialogs keyed by the rows they display
+    _dialog_cache: "OrderedDict[Tuple[Tuple[str, str, str, str], ...], SymbolSearchDialog]" = OrderedDict()
+
     def __init__(self, parent: Optional[QWidget] = None, results: Optional[List[Dict[str, Any]]] = None):
         """
         Initializes the dialog with search suggestions.
@@ -48,34 +67,69 @@ class SymbolSearchDialog(QDialog):
         self.list_widget.setStyleSheet("QListWidget::item { padding: 8px; }")
         layout.addWidget(self.list_widget)
         
-        # Populate the list with formatted item details
-        for item in self.results:
-            symbol = item.get('symbol', 'Unknown')
-            name = item.get('shortname', item.get('longname', ''))
-            exch = item.get('exchange', '')
-            type_disp = item.get('typeDisp', '')
-            
-            display_text = f"{symbol} - {name} ({exch} {type_disp})"
-            list_item = QListWidgetItem(display_text)
+        # Populate the list with formatted item details. Strings are added in one
+        # batch and decorated afterwards so the view relayouts only once.
+        entries = [_display_fields(item) for item in self.results]
+        display_texts = ["%s - %s (%s %s)" % entry for entry in entries]
+        symbols = [entry[0] for entry in entries]
+
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        self.list_widget.addItems(display_texts)
+        for row, symbol in enumerate(symbols):
             # Store the raw symbol in UserRole for easy retrieval on selection
-            list_item.setData(Qt.UserRole, symbol)
-            self.list_widget.addItem(list_item)
+            self.list_widget.item(row).setData(_USER_ROLE, symbol)
+        self.list_widget.blockSignals(False)
+        self.list_widget.setUpdatesEnabled(True)
 
         # Pre-select the top result for convenience
-        if self.list_widget.count() > 0:
+        if self.results:
             self.list_widget.setCurrentRow(0)
 
         # Standard OK/Cancel button box
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons = QDialogButtonBox(_OK_CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    @classmethod
+    def get_or_create(cls, parent: Optional[QWidget], results: List[Dict[str, Any]]) -> "SymbolSearchDialog":
+        """
+        Returns a dialog for the given results, reusing a previously built one
+        when the same suggestions were shown recently.
+        
+        Args:
+            parent: The parent window for modal behavior.
+            results: A list of result dictionaries from yfinance Search.
+        """
+        key = tuple(_display_fields(item) for item in results)
+        dialog = cls._dialog_cache.get(key)
+        if dialog is not None:
+            if dialog.parentWidget() is parent:
+                cls._dialog_cache.move_to_end(key)
+                # Same rows on screen; refresh the raw results and reset the
+                # selection state left over from the previous showing
+                dialog.results = results
+                dialog.selected_symbol = None
+                if dialog.results:
+                    dialog.list_widget.setCurrentRow(0)
+                return dialog
+            # Built for another window; it is replaced below
+            dialog.deleteLater()
+
+        dialog = cls(parent, results)
+        cls._dialog_cache[key] = dialog
+        cls._dialog_cache.move_to_end(key)
+        if len(cls._dialog_cache) > _DIALOG_CACHE_SIZE:
+            _, evicted = cls._dialog_cache.popitem(last=False)
+            evicted.deleteLater()
+        return dialog
+
     def accept(self):
         """Overrides QDialog.accept to capture the selected symbol before closing."""
         current_item = self.list_widget.currentItem()
         if current_item:
-            self.selected_symbol = current_item.data(Qt.UserRole)
+            self.selected_symbol = current_item.data(_USER_ROLE)
             super().accept()
         else:
             # Prevent closing with 'OK' if no item is selected
@@ -2,62 +2,182 @@
 Sidebar component for chart settings and indicator controls.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterable, Union
 from PySide6.QtWidgets import (QVBoxLayout, QWidget, QCheckBox, QFrame, 
                              QSizePolicy, QSpinBox, QComboBox, QLabel, QFormLayout, 
-                             QApplication, QHBoxLayout, QToolButton)
-from PySide6.QtCore import Qt, Signal
+                             QApplication, QHBoxLayout, QToolButton, QButtonGroup, QLayout)
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QMargins
+from PySide6.QtGui import QFont, QStandardItemModel, QStandardItem
 from models.enums import Interval, MAType, ChartType
+from views.themes import Theme
+
+# Enum members snapshotted once; iterating an Enum class rebuilds its member list
+_INTERVALS = tuple(Interval)
+_CHART_TYPES = tuple(ChartType)
+_MA_TYPES = tuple(MAType)
+
+# Hint shown on every section header while tooltips are enabled
+_SECTION_TOOLTIP = "Click to expand/collapse"
+
+# Layout margins shared by every section instead of four ints per call
+_ZERO_MARGINS = QMargins(0, 0, 0, 0)
+_HEADER_MARGINS = QMargins(5, 5, 5, 5)
+_CONTENT_MARGINS = QMargins(25, 5, 5, 10)
+
+# Combo contents as (label, userData) pairs, computed once at import
+_INTERVAL_ITEMS = tuple((i.name.replace("_", " ").title(), i.value) for i in _INTERVALS)
+_CHART_TYPE_ITEMS = tuple((ct.value, None) for ct in _CHART_TYPES)
+_MA_TYPE_ITEMS = tuple((ma.name, ma.value) for ma in _MA_TYPES)
+# Interval codes by combo row, so a change maps its index straight to the code
+_INTERVAL_CODES = tuple(data for _, data in _INTERVAL_ITEMS)
+
+
+# One prebuilt item model per combo table; the enum-backed contents never change
+_combo_models: Dict[Tuple[tuple, ...], QStandardItemModel] = {}
+
+
+def _combo_model(items: Tuple[tuple, ...]) -> QStandardItemModel:
+    """Returns the shared model holding the (label, userData) items, building it once."""
+    model = _combo_models.get(items)
+    if model is None:
+        model = QStandardItemModel(len(items), 1)
+        for row, (label, data) in enumerate(items):
+            item = QStandardItem(label)
+            if data is not None:
+                item.setData(data, Qt.UserRole)
+            model.setItem(row, 0, item)
+        _combo_models[items] = model
+    return model
+
+
+def _fill_combo(combo: QComboBox, items: Tuple[tuple, ...]):
+    """Attaches the shared model for the items: a single model swap instead of per-row inserts."""
+    combo.blockSignals(True)
+    combo.setModel(_combo_model(items))
+    combo.blockSignals(False)
+
+
+def _configure_form(form: QFormLayout) -> QFormLayout:
+    """Applies the settings every sidebar form shares: flush margins, one row per field."""
+    form.setContentsMargins(_ZERO_MARGINS)
+    form.setRowWrapPolicy(QFormLayout.DontWrapRows)
+    return form
+
+
+# Bold label fonts keyed by point-size delta, shared by every header label
+_bold_fonts: Dict[int, QFont] = {}
+
+
+def _bold_label_font(size_delta: int = 0) -> QFont:
+    """Returns the shared bold label font, built on first use (needs a QApplication)."""
+    font = _bold_fonts.get(size_delta)
+    if font is None:
+        # Only the attributes set here override the inherited font, so an
+        # undecorated size keeps following application font changes
+        font = QFont()
+        font.setBold(True)
+        if size_delta:
+            font.setPointSize(QApplication.font("QLabel").pointSize() + size_delta)
+        _bold_fonts[size_delta] = font
+    return font
+
+
+class _ClickableHeader(QWidget):
+    """Section header bar that reports mouse presses as a signal."""
+    clicked = Signal()
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        # Python subclasses need this to paint their stylesheet background
+        self.setAttribute(Qt.WA_StyledBackground, True)
+
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+
 
 class CollapsibleSection(QWidget):
-    """A toggleable container for grouping related settings."""
-    def __init__(self, title: str, parent: Optional[QWidget] = None):
+    """
+    A toggleable container for grouping related settings.
+
+    With a content_factory the section may start collapsed; its content widget
+    is then only created (and handed to the factory) on first expansion.
+    """
+    def __init__(self, title: str, parent: Optional[QWidget] = None,
+                 content_factory: Optional[Callable[["CollapsibleSection"], None]] = None,
+                 expanded: bool = True):
         super().__init__(parent)
-        self._is_expanded = True
+        self._is_expanded = expanded
+        self._content_factory = content_factory
         self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
         self.main_layout.setSpacing(0)
 
-        self.header = QWidget()
+        self.header = _ClickableHeader()
+        # Styled from the sidebar's stylesheet via this object name
+        self.header.setObjectName("CollapsibleHeader")
         self.header.setCursor(Qt.PointingHandCursor)
         self.header_layout = QHBoxLayout(self.header)
-        self.header_layout.setContentsMargins(5, 5, 5, 5)
+        self.header_layout.setContentsMargins(_HEADER_MARGINS)
 
         self.toggle_btn = QToolButton()
-        self.toggle_btn.setArrowType(Qt.DownArrow)
+        self.toggle_btn.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
         self.toggle_btn.setFixedSize(20, 20)
         self.toggle_btn.setStyleSheet("border: none; background: transparent;")
         
         self.title_label = QLabel(title.upper())
-        font = self.title_label.font()
-        font.setBold(True)
-        self.title_label.setFont(font)
+        self.title_label.setFont(_bold_label_font())
 
         self.header_layout.addWidget(self.toggle_btn)
         self.header_layout.addWidget(self.title_label)
         self.header_layout.addStretch()
 
-        self.content = QWidget()
-        self.content_layout = QVBoxLayout(self.content)
-        self.content_layout.setContentsMargins(25, 5, 5, 10)
+        self.content: Optional[QWidget] = None
+        self.content_layout: Optional[QVBoxLayout] = None
 
         self.main_layout.addWidget(self.header)
+        if expanded or content_factory is None:
+            self.ensure_built()
+            self.content.setVisible(expanded)
+        # Widgets that carry the expand/collapse hint
+        self.tooltip_targets = (self.header, self.toggle_btn)
+        self.header.clicked.connect(self.toggle)
+
+    def ensure_built(self):
+        """Creates the content area and runs the content factory, once."""
+        if self.content is not None:
+            return
+        self.content = QWidget()
+        self.content_layout = QVBoxLayout(self.content)
+        self.content_layout.setContentsMargins(_CONTENT_MARGINS)
         self.main_layout.addWidget(self.content)
-        self.header.mousePressEvent = lambda e: self.toggle()
+        if self._content_factory is not None:
+            factory, self._content_factory = self._content_factory, None
+            factory(self)
 
+    @Slot()
     def toggle(self):
         self._is_expanded = not self._is_expanded
+        if self._is_expanded:
+            self.ensure_built()
         self.content.setVisible(self._is_expanded)
         self.toggle_btn.setArrowType(Qt.DownArrow if self._is_expanded else Qt.RightArrow)
 
-    def set_tooltips_enabled(self, enabled: bool):
-        t = "Click to expand/collapse" if enabled else ""
-        self.header.setToolTip(t)
-        self.toggle_btn.setToolTip(t)
-
     def add_layout(self, layout): self.content_layout.addLayout(layout)
     def add_widget(self, widget): self.content_layout.addWidget(widget)
-    def set_header_style(self, s): self.header.setStyleSheet(s)
+
+    def batch_add(self, items: Iterable[Union[QWidget, QLayout]]):
+        """Adds widgets and layouts in order, with the content layout recomputed once at the end."""
+        layout = self.content_layout
+        layout.setEnabled(False)
+        try:
+            for item in items:
+                if isinstance(item, QLayout):
+                    layout.addLayout(item)
+                else:
+                    layout.addWidget(item)
+        finally:
+            layout.setEnabled(True)
+            layout.invalidate()
 
 class SidebarView(QFrame):
     """
@@ -68,29 +188,48 @@ class SidebarView(QFrame):
     setting_changed = Signal()
     font_settings_changed = Signal()
 
+    # Composed sidebar stylesheet per theme
+    _qss_cache: Dict[Theme, str] = {}
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setMinimumWidth(280)
-        self._tooltips = {}
-        self._init_ui()
+        
+        # Rapid edits (typing "200", wheel-spinning) coalesce into one notification
+        self._setting_timer = QTimer(self)
+        self._setting_timer.setSingleShot(True)
+        self._setting_timer.setInterval(50)
+        self._setting_timer.timeout.connect(self.setting_changed)
+        self._font_timer = QTimer(self)
+        self._font_timer.setSingleShot(True)
+        self._font_timer.setInterval(50)
+        self._font_timer.timeout.connect(self.font_settings_changed)
+        
+        # Suspend painting and outgoing notifications while ~40 child widgets are
+        # created and laid out; one repaint follows
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self._init_ui()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self.update()
         self.set_tooltips_enabled(True)
 
     def _init_ui(self):
         self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
         self.main_layout.setSpacing(1)
 
         # 1. Data Settings
         self.data_section = CollapsibleSection("Data Settings")
         self.interval_combo = QComboBox()
-        for i in Interval:
-            # Map enum name to a readable label
-            label = i.name.replace("_", " ").title()
-            self.interval_combo.addItem(label, i.value)
+        _fill_combo(self.interval_combo, _INTERVAL_ITEMS)
         self.interval_combo.setCurrentIndex(8) # Default: 1d
-        self.interval_combo.currentIndexChanged.connect(lambda: self.interval_changed.emit(self.interval_combo.currentData()))
+        self.interval_combo.currentIndexChanged.connect(self._on_interval_changed)
         
-        ds_layout = QFormLayout()
+        ds_layout = _configure_form(QFormLayout())
         ds_layout.addRow("Interval:", self.interval_combo)
         self.data_section.add_layout(ds_layout)
         self.main_layout.addWidget(self.data_section)
@@ -98,9 +237,8 @@ class SidebarView(QFrame):
         # 2. Chart Type
         self.chart_section = CollapsibleSection("Chart Type")
         self.chart_type_combo = QComboBox()
-        for ct in ChartType:
-            self.chart_type_combo.addItem(ct.value)
-        self.chart_type_combo.currentTextChanged.connect(self.chart_type_changed.emit)
+        _fill_combo(self.chart_type_combo, _CHART_TYPE_ITEMS)
+        self.chart_type_combo.currentTextChanged.connect(self.chart_type_changed)
         self.chart_section.add_widget(self.chart_type_combo)
         self.main_layout.addWidget(self.chart_section)
 
@@ -111,12 +249,11 @@ class SidebarView(QFrame):
         self.td_label = self._create_header_label("TD SEQUENTIAL")
         self.td_checkbox = QCheckBox("Show TD Sequential")
         self.td_checkbox.setChecked(True)
-        self.td_checkbox.stateChanged.connect(lambda s: self._toggle_td_settings(s))
-        self.td_checkbox.stateChanged.connect(lambda: self.setting_changed.emit())
+        self.td_checkbox.stateChanged.connect(self._toggle_td_settings)
+        self.td_checkbox.stateChanged.connect(self._emit_setting_changed)
         
         self.td_container = QWidget()
-        td_form = QFormLayout(self.td_container)
-        td_form.setContentsMargins(0, 0, 0, 0)
+        td_form = _configure_form(QFormLayout(self.td_container))
         self.lookback_spin = self._create_spin(1, 20, 4)
         self.setup_spin = self._create_spin(2, 50, 9)
         self.countdown_spin = self._create_spin(2, 100, 13)
@@ -124,35 +261,70 @@ class SidebarView(QFrame):
         td_form.addRow("Setup:", self.setup_spin)
         td_form.addRow("Countdown:", self.countdown_spin)
         
-        self.indicator_section.add_widget(self.td_label)
-        self.indicator_section.add_widget(self.td_checkbox)
-        self.indicator_section.add_widget(self.td_container)
-        
         self.indicator_sep = QFrame()
         self.indicator_sep.setFrameShape(QFrame.HLine)
-        self.indicator_section.add_widget(self.indicator_sep)
+        self.indicator_sep.setObjectName("IndicatorSep")
 
         # Bollinger Bands
         self.bb_label = self._create_header_label("BOLLINGER BANDS")
         self.bb_checkbox = QCheckBox("Show Bollinger Bands")
-        self.bb_checkbox.stateChanged.connect(lambda s: self._toggle_bb_settings(s))
-        self.bb_checkbox.stateChanged.connect(lambda: self.setting_changed.emit())
+        self.bb_checkbox.stateChanged.connect(self._toggle_bb_settings)
+        self.bb_checkbox.stateChanged.connect(self._emit_setting_changed)
+        
+        # The settings panel is built on first use; most sessions never enable BB
+        self.bb_container: Optional[QWidget] = None
+        self.bb_period_spin: Optional[QSpinBox] = None
+        self.bb_ma_type_combo: Optional[QComboBox] = None
+        self.bb_std_1_check: Optional[QCheckBox] = None
+        self.bb_std_2_check: Optional[QCheckBox] = None
+        self.bb_std_3_check: Optional[QCheckBox] = None
+        self.bb_std_group: Optional[QButtonGroup] = None
         
+        self.indicator_section.batch_add((self.td_label, self.td_checkbox, self.td_container,
+                                          self.indicator_sep, self.bb_label, self.bb_checkbox))
+        self.main_layout.addWidget(self.indicator_section)
+
+        # 4. Font Sizes: starts collapsed; the spins are created on first expansion
+        self.base_font_spin: Optional[QSpinBox] = None
+        self.header_offset_spin: Optional[QSpinBox] = None
+        self.labels_offset_spin: Optional[QSpinBox] = None
+        self.td_setup_offset_spin: Optional[QSpinBox] = None
+        self.td_countdown_offset_spin: Optional[QSpinBox] = None
+        self.font_section = CollapsibleSection("Font Sizes (Relative)",
+                                               content_factory=self._build_font_content,
+                                               expanded=False)
+        self.main_layout.addWidget(self.font_section)
+
+        self.main_layout.addStretch()
+
+        # Every widget carrying a section tooltip, flattened once and walked on each toggle
+        self._tooltip_targets: Tuple[QWidget, ...] = tuple(
+            w for s in (self.data_section, self.chart_section, self.indicator_section, self.font_section)
+            for w in s.tooltip_targets
+        )
+
+    def _ensure_bb_built(self):
+        """Creates the Bollinger Bands settings panel the first time it is needed."""
+        if self.bb_container is not None:
+            return
         self.bb_container = QWidget()
         self.bb_container.setVisible(False)
-        bb_form = QFormLayout(self.bb_container)
-        bb_form.setContentsMargins(0, 0, 0, 0)
+        bb_form = _configure_form(QFormLayout(self.bb_container))
         self.bb_period_spin = self._create_spin(1, 200, 20)
         self.bb_ma_type_combo = QComboBox()
-        for ma in MAType: self.bb_ma_type_combo.addItem(ma.name, ma.value)
-        self.bb_ma_type_combo.currentIndexChanged.connect(lambda: self.setting_changed.emit())
+        _fill_combo(self.bb_ma_type_combo, _MA_TYPE_ITEMS)
+        self.bb_ma_type_combo.currentIndexChanged.connect(self._emit_setting_changed)
         
         self.bb_std_1_check = QCheckBox("1 SD")
         self.bb_std_2_check = QCheckBox("2 SD")
         self.bb_std_3_check = QCheckBox("3 SD")
         self.bb_std_2_check.setChecked(True)
-        for cb in [self.bb_std_1_check, self.bb_std_2_check, self.bb_std_3_check]:
-            cb.stateChanged.connect(lambda: self.setting_changed.emit())
+        # Non-exclusive group: one connection for all bands; button ids are the SD multipliers
+        self.bb_std_group = QButtonGroup(self)
+        self.bb_std_group.setExclusive(False)
+        for sd, cb in enumerate([self.bb_std_1_check, self.bb_std_2_check, self.bb_std_3_check], start=1):
+            self.bb_std_group.addButton(cb, sd)
+        self.bb_std_group.buttonToggled.connect(self._emit_setting_changed)
 
         bb_form.addRow("Period:", self.bb_period_spin)
         bb_form.addRow("MA Type:", self.bb_ma_type_combo)
@@ -160,14 +332,12 @@ class SidebarView(QFrame):
         std_box.addWidget(self.bb_std_1_check); std_box.addWidget(self.bb_std_2_check); std_box.addWidget(self.bb_std_3_check)
         bb_form.addRow("Bands:", std_box)
         
-        self.indicator_section.add_widget(self.bb_label)
-        self.indicator_section.add_widget(self.bb_checkbox)
+        # The panel is the last entry of the indicators section
         self.indicator_section.add_widget(self.bb_container)
-        self.main_layout.addWidget(self.indicator_section)
 
-        # 4. Font Sizes
-        self.font_section = CollapsibleSection("Font Sizes (Relative)")
-        f_form = QFormLayout()
+    def _build_font_content(self, section: CollapsibleSection):
+        """Fills the font size section; nothing reads these spins before it is opened."""
+        f_form = _configure_form(QFormLayout())
         self.base_font_spin = self._create_font_spin(6, 32, 13)
         self.header_offset_spin = self._create_font_spin(-10, 10, 2)
         self.labels_offset_spin = self._create_font_spin(-10, 10, -3)
@@ -179,43 +349,71 @@ class SidebarView(QFrame):
         f_form.addRow("Labels Off:", self.labels_offset_spin)
         f_form.addRow("TD Setup Off:", self.td_setup_offset_spin)
         f_form.addRow("TD Count Off:", self.td_countdown_offset_spin)
-        self.font_section.add_layout(f_form)
-        self.main_layout.addWidget(self.font_section)
+        section.add_layout(f_form)
 
-        self.main_layout.addStretch()
+    def active_sds(self) -> List[float]:
+        """Returns the checked Bollinger standard-deviation multipliers in ascending order."""
+        if self.bb_std_group is None:
+            return []
+        return [float(self.bb_std_group.id(cb)) for cb in self.bb_std_group.buttons() if cb.isChecked()]
 
     def _create_header_label(self, text):
         lbl = QLabel(text)
-        f = lbl.font(); f.setBold(True); f.setPointSize(f.pointSize()-1)
-        lbl.setFont(f)
+        lbl.setFont(_bold_label_font(-1))
         return lbl
 
     def _create_spin(self, min_v, max_v, def_v):
         s = QSpinBox()
         s.setRange(min_v, max_v); s.setValue(def_v)
-        s.valueChanged.connect(lambda: self.setting_changed.emit())
+        s.valueChanged.connect(self._emit_setting_changed)
         return s
 
     def _create_font_spin(self, min_v, max_v, def_v):
         s = QSpinBox()
         s.setRange(min_v, max_v); s.setValue(def_v)
-        s.valueChanged.connect(lambda: self.font_settings_changed.emit())
+        s.valueChanged.connect(self._emit_font_settings_changed)
         return s
 
+    @Slot()
+    def _emit_setting_changed(self, *_):
+        # Restarting a pending timer drops the earlier notification
+        self._setting_timer.start()
+
+    @Slot()
+    def _emit_font_settings_changed(self, *_):
+        self._font_timer.start()
+
+    @Slot(int)
+    def _on_interval_changed(self, index):
+        if index >= 0:
+            self.interval_changed.emit(_INTERVAL_CODES[index])
+
+    @Slot(int)
     def _toggle_td_settings(self, state):
-        self.td_container.setVisible(state == Qt.Checked or state == 2)
+        self.td_container.setVisible(self.td_checkbox.isChecked())
 
+    @Slot(int)
     def _toggle_bb_settings(self, state):
-        self.bb_container.setVisible(state == Qt.Checked or state == 2)
+        checked = self.bb_checkbox.isChecked()
+        if checked:
+            self._ensure_bb_built()
+        if self.bb_container is not None:
+            self.bb_container.setVisible(checked)
 
     def set_tooltips_enabled(self, enabled):
-        for s in [self.data_section, self.chart_section, self.indicator_section, self.font_section]:
-            s.set_tooltips_enabled(enabled)
-
-    def apply_theme_styles(self, theme):
-        self.setStyleSheet(f"SidebarView {{ background-color: {theme['widget_bg']}; color: {theme['text_main']}; border: none; }}")
-        hs = f"QWidget {{ background-color: {theme['status_bg']}; color: {theme['status_text']}; border-bottom: 1px solid {theme['window_bg']}; }}"
-        for s in [self.data_section, self.chart_section, self.indicator_section, self.font_section]:
-            s.set_header_style(hs)
-        if hasattr(self, 'indicator_sep'):
-            self.indicator_sep.setStyleSheet(f"background-color: {theme['window_bg']}; max-height: 1px; border: none;")
\ No newline at end of file
+        tip = _SECTION_TOOLTIP if enabled else ""
+        for w in self._tooltip_targets:
+            w.setToolTip(tip)
+
+    def apply_theme_styles(self, theme: Theme):
+        qss = self._qss_cache.get(theme)
+        if qss is None:
+            # One sheet for the panel, section headers and separator: a single parse and polish pass
+            qss = self._qss_cache[theme] = (
+                f"SidebarView {{ background-color: {theme.widget_bg}; color: {theme.text_main}; border: none; }}\n"
+                f"#CollapsibleHeader, #CollapsibleHeader QWidget {{ background-color: {theme.status_bg}; "
+                f"color: {theme.status_text}; border-bottom: 1px solid {theme.window_bg}; }}\n"
+                f"#IndicatorSep {{ background-color: {theme.window_bg}; max-height: 1px; border: none; }}"
+            )
+        if self.styleSheet() != qss:
+            self.setStyleSheet(qss)
\ No newline at end of file
@@ -6,85 +6,159 @@ Each theme defines colors for the window, widgets, buttons, and specific
 technical indicators on the chart.
 """
 
-from typing import Dict
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, Mapping
+from PySide6.QtGui import QColor
 
-# Dictionary containing all available color schemes.
+
+@dataclass(frozen=True)
+class Theme:
+    """
+    A complete color palette. Every field is a hex color string.
+    
+    Fields are read as attributes (theme.widget_bg); paint code that selects
+    colors by name at runtime goes through theme_colors() instead.
+    """
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "window_bg", "widget_bg", "button_bg", "button_hover", "status_bg",
+        "status_text", "text_main", "text_label",
+        "chart_bg", "grid", "bull", "bear", "crosshair",
+        "setup_buy", "setup_sell", "cd_buy", "cd_sell", "perfected",
+        "bb_mid", "bb_upper", "bb_lower",
+    )
+    
+    # UI Elements
+    window_bg: str
+    widget_bg: str
+    button_bg: str
+    button_hover: str
+    status_bg: str
+    status_text: str
+    text_main: str
+    text_label: str
+    
+    # Chart Elements
+    chart_bg: str
+    grid: str
+    bull: str
+    bear: str
+    crosshair: str
+    
+    # TD Sequential Indicator
+    setup_buy: str
+    setup_sell: str
+    cd_buy: str
+    cd_sell: str
+    perfected: str
+    
+    # Bollinger Bands Indicator
+    bb_mid: str
+    bb_upper: str
+    bb_lower: str
+
+
+# All available color schemes, read-only. Themes are hashable, so views
+# may key caches on them.
 # Keys are theme names used in the 'View -> Color Scheme' menu.
-THEMES: Dict[str, Dict[str, str]] = {
-    "Default": {
+THEMES: Mapping[str, Theme] = MappingProxyType({
+    "Default": Theme(
         # UI Elements
-        "window_bg": "#1e1e1e",
-        "widget_bg": "#333333",
-        "button_bg": "#444444",
-        "button_hover": "#555555",
-        "status_bg": "#222222",
-        "status_text": "#aaaaaa",
-        "text_main": "#ffffff",
-        "text_label": "#808080",
+        window_bg="#1e1e1e",
+        widget_bg="#333333",
+        button_bg="#444444",
+        button_hover="#555555",
+        status_bg="#222222",
+        status_text="#aaaaaa",
+        text_main="#ffffff",
+        text_label="#808080",
         
         # Chart Elements
-        "chart_bg": "#1e1e1e",
-        "grid": "#3c3c3c",
-        "bull": "#00c800",
-        "bear": "#c80000",
-        "crosshair": "#969696",
+        chart_bg="#1e1e1e",
+        grid="#3c3c3c",
+        bull="#00c800",
+        bear="#c80000",
+        crosshair="#969696",
         
         # TD Sequential Indicator
-        "setup_buy": "#00ff00",
-        "setup_sell": "#ff3232",
-        "cd_buy": "#00ffff",
-        "cd_sell": "#ffff00",
-        "perfected": "#ff00ff",
+        setup_buy="#00ff00",
+        setup_sell="#ff3232",
+        cd_buy="#00ffff",
+        cd_sell="#ffff00",
+        perfected="#ff00ff",
         
         # Bollinger Bands Indicator
-        "bb_mid": "#ffaa00",
-        "bb_upper": "#00aaff",
-        "bb_lower": "#ff00aa"
-    },
-    "Lilac": {
-        "window_bg": "#2c2433",
-        "widget_bg": "#3d3245",
-        "button_bg": "#4f4159",
-        "button_hover": "#62526e",
-        "status_bg": "#241d29",
-        "status_text": "#b39ddb",
-        "text_main": "#f3e5f5",
-        "text_label": "#b39ddb",
-        "chart_bg": "#2c2433",
-        "grid": "#463d4d",
-        "bull": "#b39ddb",
-        "bear": "#f48fb1",
-        "setup_buy": "#9575cd",
-        "setup_sell": "#f06292",
-        "cd_buy": "#81d4fa",
-        "cd_sell": "#fff176",
-        "perfected": "#ce93d8",
-        "crosshair": "#7e57c2",
-        "bb_mid": "#b39ddb",
-        "bb_upper": "#81d4fa",
-        "bb_lower": "#f48fb1"
-    },
-    "Dracula": {
-        "window_bg": "#282a36",
-        "widget_bg": "#44475a",
-        "button_bg": "#6272a4",
-        "button_hover": "#7384b5",
-        "status_bg": "#191a21",
-        "status_text": "#6272a4",
-        "text_main": "#f8f8f2",
-        "text_label": "#6272a4",
-        "chart_bg": "#282a36",
-        "grid": "#44475a",
-        "bull": "#50fa7b",
-        "bear": "#ff5555",
-        "setup_buy": "#50fa7b",
-        "setup_sell": "#ff5555",
-        "cd_buy": "#8be9fd",
-        "cd_sell": "#f1fa8c",
-        "perfected": "#ff79c6",
-        "crosshair": "#6272a4",
-        "bb_mid": "#ffb86c",
-        "bb_upper": "#8be9fd",
-        "bb_lower": "#ff79c6"
-    }
-}
\ No newline at end of file
+        bb_mid="#ffaa00",
+        bb_upper="#00aaff",
+        bb_lower="#ff00aa"
+    ),
+    "Lilac": Theme(
+        window_bg="#2c2433",
+        widget_bg="#3d3245",
+        button_bg="#4f4159",
+        button_hover="#62526e",
+        status_bg="#241d29",
+        status_text="#b39ddb",
+        text_main="#f3e5f5",
+        text_label="#b39ddb",
+        chart_bg="#2c2433",
+        grid="#463d4d",
+        bull="#b39ddb",
+        bear="#f48fb1",
+        setup_buy="#9575cd",
+        setup_sell="#f06292",
+        cd_buy="#81d4fa",
+        cd_sell="#fff176",
+        perfected="#ce93d8",
+        crosshair="#7e57c2",
+        bb_mid="#b39ddb",
+        bb_upper="#81d4fa",
+        bb_lower="#f48fb1"
+    ),
+    "Dracula": Theme(
+        window_bg="#282a36",
+        widget_bg="#44475a",
+        button_bg="#6272a4",
+        button_hover="#7384b5",
+        status_bg="#191a21",
+        status_text="#6272a4",
+        text_main="#f8f8f2",
+        text_label="#6272a4",
+        chart_bg="#282a36",
+        grid="#44475a",
+        bull="#50fa7b",
+        bear="#ff5555",
+        setup_buy="#50fa7b",
+        setup_sell="#ff5555",
+        cd_buy="#8be9fd",
+        cd_sell="#f1fa8c",
+        perfected="#ff79c6",
+        crosshair="#6272a4",
+        bb_mid="#ffb86c",
+        bb_upper="#8be9fd",
+        bb_lower="#ff79c6"
+    )
+})
+
+
+def _parse_colors(theme: Theme) -> Mapping[str, QColor]:
+    return MappingProxyType({f.name: QColor(getattr(theme, f.name)) for f in fields(theme)})
+
+
+# Palette colors parsed into QColor once at import, keyed by palette
+_THEME_QCOLORS: Dict[Theme, Mapping[str, QColor]] = {
+    theme: _parse_colors(theme) for theme in THEMES.values()
+}
+
+
+def theme_colors(theme: Theme) -> Mapping[str, QColor]:
+    """
+    Returns the palette as ready-made QColor objects keyed by field name.
+    
+    Serves paint code that picks a color by name at runtime (e.g. f"bb_{suffix}"); 
+    entries of THEMES come from the import-time table, any other Theme is 
+    parsed on the spot.
+    """
+    colors = _THEME_QCOLORS.get(theme)
+    return colors if colors is not None else _parse_colors(theme)